@@ -2,35 +2,375 @@
 
 __version__ = "1.4.2"
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import os
+import re
+import socket
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 
-ADMIN = "ADMIN"
+try:
+    import orjson
+except ImportError:  # Optional speedup: `pip install ahasura[speedups]`
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # Optional speedup: `pip install ahasura[speedups]`
+    simdjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # Optional speedup: `pip install ahasura[speedups]`
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # Optional speedup: `pip install ahasura[speedups]`
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401  # Optional speedup: `pip install ahasura[http2]`
+except ImportError:
+    h2 = None  # type: ignore[assignment]
+
+# Interned: `auth is ADMIN` is a pointer compare for everyone importing this name
+ADMIN = sys.intern("ADMIN")
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# TCP_NODELAY disables Nagle's algorithm: small JSON requests are flushed
+# immediately instead of waiting up to ~40 ms for a delayed ACK
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=200,
+    keepalive_expiry=30.0,
+)
+
+# Constant envelope of `run_sql` request bodies, serialized once at import time
+_RUN_SQL_PREFIX = b'{"type":"run_sql","args":{"read_only":'
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body, with `orjson` if installed, else stdlib `json`"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a response body, with `orjson` if installed, else stdlib `json`"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Compiled once at import time; matching runs in C without copying the query
+_SELECT_RE = re.compile(r"\A\s*SELECT", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _get_auth_headers(auth: str) -> Dict[str, str]:
+    """Memoized `authorization` header dict per auth string
+
+    Service-to-service callers reuse the same token for millions of calls,
+    so the dict is built once. Shared: callers must not mutate it
+    """
+    return {"authorization": auth}
+
+
+@lru_cache(maxsize=256)
+def _get_row_builder(column_names: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """Codegen a builder of row dicts with exactly these keys, memoized per columns
+
+    CPython executes the literal `{"a": row[0], "b": row[1]}` faster than
+    `dict(zip(column_names, row))`: no iterator protocol dispatch per cell
+    """
+    items = ", ".join(
+        f"{name!r}: row[{index}]" for index, name in enumerate(column_names)
+    )
+    namespace: Dict[str, Any] = {}
+    exec(f"def build_row(row): return {{{items}}}", namespace)
+    return namespace["build_row"]
+
+
+@lru_cache(maxsize=1024)
+def _get_query_hash(query: str) -> str:
+    """Memoized SHA-256 of a GraphQL query, for the persisted queries protocol"""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _is_persisted_query_not_found(response_json: Any) -> bool:
+    """Check for the standard APQ fallback signal: resend with the full query"""
+    errors = response_json.get("errors") if isinstance(response_json, dict) else None
+    if not isinstance(errors, list):
+        return False
+
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        if error.get("message") == "PersistedQueryNotFound":
+            return True
+        extensions = error.get("extensions")
+        if isinstance(extensions, dict):
+            if extensions.get("code") == "PERSISTED_QUERY_NOT_FOUND":
+                return True
+    return False
+
+
+def _is_select(query: str) -> bool:
+    """Check if `query` is a `SELECT` one, without copying the query text"""
+    return _SELECT_RE.match(query) is not None
+
+
+if msgspec is not None:
+
+    class _GqlResponse(msgspec.Struct):
+        """Known shape of a GraphQL response, decoded without intermediate dicts"""
+
+        data: Optional[Dict[str, Any]] = None
+        errors: Any = None
+
+    class _SqlResponse(msgspec.Struct):
+        """Known shape of a `run_sql` response, decoded without intermediate dicts"""
+
+        result_type: str = ""
+        result: Optional[List[List[Any]]] = None
+        error: Any = None
+
+    _gql_decoder = msgspec.json.Decoder(_GqlResponse)
+    _sql_decoder = msgspec.json.Decoder(_SqlResponse)
+else:
+    _gql_decoder = None
+    _sql_decoder = None
+
+
+_sql_parser_local = threading.local()  # One lazy `simdjson.Parser` per thread
+
+
+def _parse_sql_response(data: bytes) -> Any:
+    """Parse a `run_sql` response lazily with `pysimdjson` if installed
+
+    `_get_rows` touches only `error`, `result_type` and `result` keys,
+    so the lazy proxy avoids materializing every cell of large rowsets upfront.
+    Parsers are reused across calls but not across threads:
+    a concurrent `parse` would invalidate another thread's in-flight document
+    """
+    if simdjson is None:
+        return _loads(data)
+
+    parser = getattr(_sql_parser_local, "parser", None)
+    if parser is None:
+        parser = _sql_parser_local.parser = simdjson.Parser()
+    return parser.parse(data)
+
+
+def _materialize(response_json: Any) -> Dict[str, Any]:
+    """Convert a lazy `pysimdjson` proxy to a plain dict, e.g. for an exception
+
+    A proxy kept alive by an exception would block reuse of its parser
+    """
+    if simdjson is not None and isinstance(response_json, simdjson.Object):
+        return response_json.as_dict()
+    return response_json
+
+
+class _ResponseReader:
+    """Minimal file-like over `httpx.Response.iter_bytes()`, as `ijson` expects"""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.iter_bytes()
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:  # `ijson` probes with read(0) to detect bytes vs str mode
+            return b""
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            return b""
+
+
+class _AsyncResponseReader:
+    """Minimal file-like over `httpx.Response.aiter_bytes()`, as `ijson` expects"""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # `ijson` probes with read(0) to detect bytes vs str mode
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class _RowStream:
+    """Incremental builder of rows from `ijson` parse events
+
+    Keeps only the row being built in memory, so `sql_iter`/`asql_iter` peak
+    at O(row size) instead of O(response size)
+    """
+
+    __slots__ = ("build_row", "row", "command_ok", "builder")
+
+    build_row: Optional[Callable[[Any], Dict[str, Any]]]
+    row: List[Any]
+    command_ok: bool
+    builder: Any  # `ijson.ObjectBuilder`
+
+    def __init__(self) -> None:
+        self.build_row = None
+        self.row = []
+        self.command_ok = False
+        self.builder = ijson.ObjectBuilder()
+
+    def feed(self, prefix: str, event: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Feed one parse event. Returns a complete row, if any"""
+        if prefix == "result.item.item":
+            self.row.append(value)
+        elif prefix == "result.item" and event == "end_array":
+            row, self.row = self.row, []
+            if self.build_row is None:
+                self.build_row = _get_row_builder(tuple(row))
+            else:
+                return self.build_row(row)
+        elif prefix == "result" or prefix.startswith("result."):
+            pass  # `start_array`/`end_array` framing of the rows above
+        elif event == "map_key" and prefix == "" and value == "result":
+            pass  # Keep `result` rows out of `builder`: they are yielded
+        else:
+            # Everything but the rows: `result_type`, and on failures -
+            # `error`, `path`, `code`, the nested `internal` object
+            self.builder.event(event, value)
+            if prefix == "result_type" and event == "string":
+                self.command_ok = value == "CommandOk"
+        return None
+
+    def finish(self) -> None:
+        """Call after the last event
+
+        Raises:
+            HasuraError: If the response contains `error` key.
+                The payload carries all keys but `result`, like the buffered
+                `sql`/`asql` errors do
+        """
+        response_json = self.builder.value
+        if "error" in response_json:
+            raise HasuraError(response_json)
+
+
+# Standard GraphQL introspection query, enough for codegen and runtime validation
+_INTROSPECTION_QUERY = """
+    query IntrospectionQuery {
+        __schema {
+            queryType { name }
+            mutationType { name }
+            subscriptionType { name }
+            types { ...FullType }
+            directives { name description locations args { ...InputValue } }
+        }
+    }
+    fragment FullType on __Type {
+        kind name description
+        fields(includeDeprecated: true) {
+            name description
+            args { ...InputValue }
+            type { ...TypeRef }
+            isDeprecated deprecationReason
+        }
+        inputFields { ...InputValue }
+        interfaces { ...TypeRef }
+        enumValues(includeDeprecated: true) {
+            name description isDeprecated deprecationReason
+        }
+        possibleTypes { ...TypeRef }
+    }
+    fragment InputValue on __InputValue {
+        name description type { ...TypeRef } defaultValue
+    }
+    fragment TypeRef on __Type {
+        kind name
+        ofType {
+            kind name
+            ofType {
+                kind name
+                ofType {
+                    kind name
+                    ofType {
+                        kind name
+                        ofType {
+                            kind name
+                            ofType { kind name ofType { kind name } }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
 
 
 class Hasura:
     """Async and sync Hasura client"""
 
+    __slots__ = (
+        "graphql_endpoint",
+        "sql_endpoint",
+        "admin_secret",
+        "timeout",
+        "persisted_queries",
+        "_client",
+        "_aclient",
+        "_aclient_lock",
+        "_admin_headers",
+        "_introspection",
+    )
+
     graphql_endpoint: str
     sql_endpoint: str
-    admin_secret: Optional[str] = None
+    admin_secret: Optional[str]
     timeout: Optional[float]
+    persisted_queries: bool
+    _client: httpx.Client
+    _aclient: Optional[httpx.AsyncClient]
+    _aclient_lock: Optional[asyncio.Lock]
+    _admin_headers: Optional[Dict[str, str]]
+    _introspection: Dict[str, Tuple[Dict[str, Any], float]]
 
     def __init__(
         self,
         endpoint: str,
         admin_secret: Optional[str] = None,
         timeout: Optional[float] = 10,
+        persisted_queries: bool = False,
     ) -> None:
         """Create Hasura client
 
-        It just keeps the configuration passed, so you can reuse global client(s)
+        It keeps the configuration passed and a keep-alive connection pool,
+        so please reuse global client(s)
 
         Args:
             endpoint: `HASURA_GRAPHQL_ENDPOINT`, without trailing `/` or `/v1/graphql`
             admin_secret: `HASURA_GRAPHQL_ADMIN_SECRET`, required for `auth=ADMIN` only
             timeout: Seconds of network inactivity allowed. `None` disables the timeout
+            persisted_queries: Send SHA-256 hashes of GraphQL queries instead of
+                full texts, with automatic fallback (APQ protocol).
+                Cuts upload bytes for repeated queries, if Hasura deployment
+                supports persisted queries
 
         Examples:
             Client::
@@ -51,13 +391,80 @@ class Hasura:
         self.sql_endpoint = f"{endpoint}/v2/query"
         self.admin_secret = admin_secret
         self.timeout = timeout
+        self.persisted_queries = persisted_queries
+        self._client = httpx.Client(
+            timeout=timeout,
+            headers=_JSON_HEADERS,
+            transport=httpx.HTTPTransport(
+                limits=_LIMITS,
+                socket_options=_SOCKET_OPTIONS,
+            ),
+        )
+        self._aclient = None
+        self._aclient_lock = None
+        self._admin_headers = (
+            {"x-hasura-admin-secret": admin_secret} if admin_secret else None
+        )
+        self._introspection = {}  # Keyed by auth: schemas are role-dependent
+
+    def close(self) -> None:
+        """Close the keep-alive connection pool of the sync client
+
+        Optional: the pool is closed automatically when the client is garbage-collected
+        """
+        self._client.close()
+
+    def __enter__(self) -> "Hasura":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def _get_aclient(self) -> httpx.AsyncClient:
+        """Get the shared async client, lazily created on first use
+
+        Lazy creation binds the client (and its lock) to the running event loop,
+        so sync-only users never pay for it
+        """
+        if self._aclient is None:
+            if self._aclient_lock is None:
+                self._aclient_lock = asyncio.Lock()
+            async with self._aclient_lock:
+                if self._aclient is None:
+                    self._aclient = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        headers=_JSON_HEADERS,
+                        transport=httpx.AsyncHTTPTransport(
+                            limits=_LIMITS,
+                            socket_options=_SOCKET_OPTIONS,
+                            # Multiplex concurrent requests over one connection
+                            http2=h2 is not None,
+                        ),
+                    )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the keep-alive connection pool of the async client
+
+        Please call it at app shutdown, if `agql`/`asql` were used
+        """
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    async def __aenter__(self) -> "Hasura":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def gql(
         self,
         query: str,
         auth: str,
         headers: Optional[Dict[str, str]] = None,
-        **variables,
+        variables: Optional[Dict[str, Any]] = None,
+        **extra_variables,
     ) -> Dict[str, Any]:
         """Execute GraphQL query at Hasura, sync version
 
@@ -65,7 +472,8 @@ class Hasura:
             query: GraphQL query, e.g. `query { item { id }}`
             auth: Either `ADMIN` or value of `Authorization` header, e.g. `Bearer {JWT}`
             headers: Custom headers, if any
-            **variables: Variables used in `query`, if any
+            variables: Variables used in `query`, if any
+            **extra_variables: More variables, merged into `variables`
 
         Returns:
             GraphQL response data, e.g. `{"item": [{"id": "..."}]}`
@@ -82,14 +490,44 @@ class Hasura:
 
                 data = hasura.gql(...)
         """
-        response = httpx.post(
+        variables = self._merge_variables(variables, extra_variables)
+        request_headers = self._get_headers(auth, headers)
+
+        if self.persisted_queries:
+            return self._get_data(
+                self._gql_persisted(query, request_headers, variables)
+            )
+
+        response = self._client.post(
             self.graphql_endpoint,
-            headers=self._get_headers(auth, headers),
-            json={"query": query, "variables": variables},
-            timeout=self.timeout,
+            headers=request_headers,
+            content=self._get_gql_body(query, variables),
         )
 
-        return self._get_data(response.json())
+        return self._get_data_from_content(response.content)
+
+    def _gql_persisted(
+        self,
+        query: str,
+        request_headers: Dict[str, str],
+        variables: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        response = self._client.post(
+            self.graphql_endpoint,
+            headers=request_headers,
+            content=self._get_persisted_body(query, variables, with_query=False),
+        )
+        response_json = _loads(response.content)
+
+        if _is_persisted_query_not_found(response_json):
+            response = self._client.post(
+                self.graphql_endpoint,
+                headers=request_headers,
+                content=self._get_persisted_body(query, variables, with_query=True),
+            )
+            response_json = _loads(response.content)
+
+        return response_json
 
     __call__ = gql  # `hasura(...)` is a shortcut for `hasura.gql(...)`
 
@@ -98,7 +536,8 @@ class Hasura:
         query: str,
         auth: str,
         headers: Optional[Dict[str, str]] = None,
-        **variables,
+        variables: Optional[Dict[str, Any]] = None,
+        **extra_variables,
     ) -> Dict[str, Any]:
         """Execute GraphQL query at Hasura, async version
 
@@ -113,15 +552,162 @@ class Hasura:
 
                 data = await hasura.agql(...)
         """
-        async with httpx.AsyncClient() as ahttpx:
-            response = await ahttpx.post(
+        variables = self._merge_variables(variables, extra_variables)
+        request_headers = self._get_headers(auth, headers)
+        aclient = await self._get_aclient()
+
+        if self.persisted_queries:
+            return self._get_data(
+                await self._agql_persisted(aclient, query, request_headers, variables)
+            )
+
+        response = await aclient.post(
+            self.graphql_endpoint,
+            headers=request_headers,
+            content=self._get_gql_body(query, variables),
+        )
+
+        return self._get_data_from_content(response.content)
+
+    async def _agql_persisted(
+        self,
+        aclient: httpx.AsyncClient,
+        query: str,
+        request_headers: Dict[str, str],
+        variables: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        response = await aclient.post(
+            self.graphql_endpoint,
+            headers=request_headers,
+            content=self._get_persisted_body(query, variables, with_query=False),
+        )
+        response_json = _loads(response.content)
+
+        if _is_persisted_query_not_found(response_json):
+            response = await aclient.post(
                 self.graphql_endpoint,
-                headers=self._get_headers(auth, headers),
-                json={"query": query, "variables": variables},
-                timeout=self.timeout,
+                headers=request_headers,
+                content=self._get_persisted_body(query, variables, with_query=True),
             )
+            response_json = _loads(response.content)
+
+        return response_json
+
+    def gql_batch(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+        auth: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute multiple GraphQL queries in one request at Hasura, sync version
+
+        One round-trip instead of N: recommended e.g. for dashboards
+        rendering multiple widgets
+
+        Args:
+            queries: List of `(query, variables)` pairs. `variables` can be `None`
+            auth: Either `ADMIN` or value of `Authorization` header, e.g. `Bearer {JWT}`
+            headers: Custom headers, if any
 
-        return self._get_data(response.json())
+        Returns:
+            List of GraphQL response data, one per query, in the same order
+
+        Raises:
+            HasuraError: If JSON response from Hasura contains `errors` key
+
+        Example::
+
+            data1, data2 = hasura.gql_batch(
+                [(query1, None), (query2, {"id": some_id})],
+                auth=ADMIN,
+            )
+        """
+        response = self._client.post(
+            self.graphql_endpoint,
+            headers=self._get_headers(auth, headers),
+            content=self._get_gql_batch_body(queries),
+        )
+
+        return self._get_data_list(_loads(response.content))
+
+    async def agql_batch(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+        auth: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute multiple GraphQL queries in one request at Hasura, async version
+
+        Please see the docs of sync version
+
+        Example::
+
+            data1, data2 = await hasura.agql_batch(
+                [(query1, None), (query2, {"id": some_id})],
+                auth=ADMIN,
+            )
+        """
+        aclient = await self._get_aclient()
+        response = await aclient.post(
+            self.graphql_endpoint,
+            headers=self._get_headers(auth, headers),
+            content=self._get_gql_batch_body(queries),
+        )
+
+        return self._get_data_list(_loads(response.content))
+
+    def introspect(
+        self,
+        auth: str,
+        ttl: Optional[float] = None,
+        cache_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run the standard introspection query at Hasura, sync version
+
+        The result is cached on the client (and in `cache_path`, if any),
+        so repeated calls skip the multi-KB round-trip.
+        Schemas are role-dependent, so the cache is keyed by `auth`
+
+        Args:
+            auth: Either `ADMIN` or value of `Authorization` header, e.g. `Bearer {JWT}`
+            ttl: Seconds the cached result stays fresh. `None` caches forever
+            cache_path: File persisting the result across process restarts, if any
+
+        Returns:
+            GraphQL response data with `__schema` key
+
+        Raises:
+            HasuraError: If JSON response from Hasura contains `errors` key
+
+        Example::
+
+            schema = hasura.introspect(auth=ADMIN)["__schema"]
+        """
+        data = self._get_cached_introspection(auth, ttl, cache_path)
+        if data is None:
+            data = self.gql(_INTROSPECTION_QUERY, auth)
+            self._cache_introspection(auth, data, cache_path)
+        return data
+
+    async def aintrospect(
+        self,
+        auth: str,
+        ttl: Optional[float] = None,
+        cache_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run the standard introspection query at Hasura, async version
+
+        Please see the docs of sync version
+
+        Example::
+
+            schema = (await hasura.aintrospect(auth=ADMIN))["__schema"]
+        """
+        data = self._get_cached_introspection(auth, ttl, cache_path)
+        if data is None:
+            data = await self.agql(_INTROSPECTION_QUERY, auth)
+            self._cache_introspection(auth, data, cache_path)
+        return data
 
     def sql(
         self,
@@ -145,14 +731,13 @@ class Hasura:
 
             rows = hasura.sql(...)
         """
-        response = httpx.post(
+        response = self._client.post(
             self.sql_endpoint,
             headers=self._get_headers(ADMIN, headers),
-            json=self._get_run_sql_content(query),
-            timeout=self.timeout,
+            content=self._get_run_sql_body(query),
         )
 
-        return self._get_rows(response.json())
+        return self._get_rows_from_content(response.content)
 
     async def asql(
         self,
@@ -167,15 +752,89 @@ class Hasura:
 
             rows = await hasura.asql(...)
         """
-        async with httpx.AsyncClient() as ahttpx:
-            response = await ahttpx.post(
-                self.sql_endpoint,
-                headers=self._get_headers(ADMIN, headers),
-                json=self._get_run_sql_content(query),
-                timeout=self.timeout,
-            )
+        aclient = await self._get_aclient()
+        response = await aclient.post(
+            self.sql_endpoint,
+            headers=self._get_headers(ADMIN, headers),
+            content=self._get_run_sql_body(query),
+        )
 
-        return self._get_rows(response.json())
+        return self._get_rows_from_content(response.content)
+
+    def sql_iter(
+        self,
+        query: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Execute SQL query at Hasura, streaming rows one by one, sync version
+
+        With `ijson` installed, rows are parsed incrementally while the response
+        body is still downloading, so peak memory is O(row size) instead of
+        O(response size). Falls back to buffered `sql` otherwise
+
+        Args, rows and errors: same as `sql`, but rows are yielded one by one
+
+        Example::
+
+            for row in hasura.sql_iter('SELECT "id" FROM "big_table"'):
+                ...
+        """
+        if ijson is None:
+            yield from self.sql(query, headers)
+            return
+
+        with self._client.stream(
+            "POST",
+            self.sql_endpoint,
+            headers=self._get_headers(ADMIN, headers),
+            content=self._get_run_sql_body(query),
+        ) as response:
+            row_stream = _RowStream()
+            for prefix, event, value in ijson.parse(_ResponseReader(response)):
+                row = row_stream.feed(prefix, event, value)
+                if row is not None:
+                    yield row
+            row_stream.finish()
+
+            if row_stream.command_ok:
+                yield {"ok": True}
+
+    async def asql_iter(
+        self,
+        query: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute SQL query at Hasura, streaming rows one by one, async version
+
+        Please see the docs of sync version
+
+        Example::
+
+            async for row in hasura.asql_iter('SELECT "id" FROM "big_table"'):
+                ...
+        """
+        if ijson is None:
+            for buffered_row in await self.asql(query, headers):
+                yield buffered_row
+            return
+
+        aclient = await self._get_aclient()
+        async with aclient.stream(
+            "POST",
+            self.sql_endpoint,
+            headers=self._get_headers(ADMIN, headers),
+            content=self._get_run_sql_body(query),
+        ) as response:
+            row_stream = _RowStream()
+            events = ijson.parse_async(_AsyncResponseReader(response))
+            async for prefix, event, value in events:
+                row = row_stream.feed(prefix, event, value)
+                if row is not None:
+                    yield row
+            row_stream.finish()
+
+            if row_stream.command_ok:
+                yield {"ok": True}
 
     # Private DRY implementation parts of the public API above:
 
@@ -184,28 +843,187 @@ class Hasura:
         auth: str,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, str]:
-        if auth == ADMIN:
-            assert self.admin_secret
-            result = {"x-hasura-admin-secret": self.admin_secret}
-        else:
-            result = {"authorization": auth}
+        if auth is ADMIN or auth == ADMIN:
+            assert self._admin_headers
+            if headers is None:
+                # Precomputed shared dict, so callers must not mutate it
+                return self._admin_headers
+            return {**self._admin_headers, **headers}
 
+        result = _get_auth_headers(auth)
         if headers:
-            result.update(headers)
+            return {**result, **headers}
         return result
 
-    def _get_run_sql_content(self, query: str) -> Dict[str, Any]:
-        read_only = query.lstrip()[:6].upper() == "SELECT"
-        return {"type": "run_sql", "args": {"sql": query, "read_only": read_only}}
+    def _merge_variables(
+        self,
+        variables: Optional[Dict[str, Any]],
+        extra_variables: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        if extra_variables:
+            return {**variables, **extra_variables} if variables else extra_variables
+        return variables
+
+    def _get_gql_body(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+    ) -> bytes:
+        if variables:
+            return _dumps({"query": query, "variables": variables})
+        # Hasura tolerates a missing `variables` key,
+        # so variable-less queries skip the empty dict and its serialized bytes
+        return _dumps({"query": query})
+
+    def _get_persisted_body(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        with_query: bool,
+    ) -> bytes:
+        # The first attempt sends only the ~68-byte hash. `with_query=True` is
+        # the fallback after `PersistedQueryNotFound`: it registers the query
+        body: Dict[str, Any] = {}
+        if with_query:
+            body["query"] = query
+        if variables:
+            body["variables"] = variables
+        body["extensions"] = {
+            "persistedQuery": {"version": 1, "sha256Hash": _get_query_hash(query)}
+        }
+        return _dumps(body)
+
+    def _get_gql_batch_body(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+    ) -> bytes:
+        return _dumps(
+            [
+                {"query": query, "variables": variables}
+                if variables
+                else {"query": query}
+                for query, variables in queries
+            ]
+        )
+
+    def _get_run_sql_body(self, query: str) -> bytes:
+        # Only the SQL text and the read_only flag vary, so skip serializing
+        # (and allocating) the 3-level envelope dict per call
+        read_only = _is_select(query)
+        return b"".join(
+            (
+                _RUN_SQL_PREFIX,
+                b"true" if read_only else b"false",
+                b',"sql":',
+                _dumps(query),
+                b"}}",
+            )
+        )
 
     def _get_data(self, response_json: Dict[str, Any]) -> Dict[str, Any]:
         if "errors" in response_json:
             raise HasuraError(response_json)
 
-        data = response_json["data"]
-        assert isinstance(data, dict)
+        # No isinstance check: Hasura guarantees `data` is an object
+        # when there are no `errors`, so skip the per-response type check
+        return response_json["data"]
+
+    def _get_data_from_content(self, content: bytes) -> Dict[str, Any]:
+        if _gql_decoder is not None:
+            # Single C-level pass: no intermediate dict, no Python key lookups
+            response = _gql_decoder.decode(content)
+            if response.errors is not None:
+                # Re-decode generically: the typed struct drops extra error
+                # keys like `path` and `code`, but `HasuraError.response`
+                # must carry the full payload
+                raise HasuraError(_loads(content))
+            return response.data or {}
+
+        return self._get_data(_loads(content))
+
+    def _get_rows_from_content(self, content: bytes) -> List[Dict[str, Any]]:
+        if _sql_decoder is not None:
+            response = _sql_decoder.decode(content)
+            if response.error is not None:
+                # Full payload, same as the GraphQL error branch
+                raise HasuraError(_loads(content))
+            # Rows are already plain lists here, so `_get_rows` only zips them
+            return self._get_rows(
+                {"result_type": response.result_type, "result": response.result}
+            )
+
+        if simdjson is not None:
+            response_json = _parse_sql_response(content)
+            if "error" in response_json:
+                # Re-decode to a plain dict: `HasuraError.response` must stay
+                # comparable, and a live proxy would block parser reuse
+                del response_json
+                raise HasuraError(_loads(content))
+            return self._get_rows(response_json)
+
+        return self._get_rows(_loads(content))
+
+    def _get_data_list(
+        self,
+        response_json: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        if isinstance(response_json, dict):
+            # Request-level failure, e.g. bad auth: a single error object
+            # instead of a list of per-query responses
+            raise HasuraError(response_json)
+
+        for item in response_json:
+            if "errors" in item:
+                raise HasuraError(item)
+
+        return [item["data"] for item in response_json]
+
+    def _get_introspection_path(self, cache_path: str, auth: str) -> str:
+        # Schemas are role-dependent, so each auth gets its own cache file
+        auth_hash = hashlib.sha256(auth.encode()).hexdigest()[:16]
+        return f"{cache_path}.{auth_hash}"
+
+    def _get_cached_introspection(
+        self,
+        auth: str,
+        ttl: Optional[float],
+        cache_path: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        cached = self._introspection.get(auth)
+
+        if cached is None and cache_path is not None:
+            auth_path = self._get_introspection_path(cache_path, auth)
+            try:
+                with open(auth_path, "rb") as cache_file:
+                    cached = (_loads(cache_file.read()), os.path.getmtime(auth_path))
+                self._introspection[auth] = cached
+            except (OSError, ValueError):
+                # Not persisted yet, or truncated by a crash mid-write:
+                # refetch and overwrite
+                return None
+
+        if cached is None:
+            return None
+
+        data, cached_time = cached
+        if ttl is not None and time.time() - cached_time > ttl:
+            return None
+
         return data
 
+    def _cache_introspection(
+        self,
+        auth: str,
+        data: Dict[str, Any],
+        cache_path: Optional[str],
+    ) -> None:
+        self._introspection[auth] = (data, time.time())
+
+        if cache_path is not None:
+            auth_path = self._get_introspection_path(cache_path, auth)
+            with open(auth_path, "wb") as cache_file:
+                cache_file.write(_dumps(data))
+
     def _get_rows(self, response_json: Dict[str, Any]) -> List[Dict[str, Any]]:
         if "error" in response_json:
             raise HasuraError(response_json)
@@ -213,10 +1031,10 @@ class Hasura:
         if response_json["result_type"] == "CommandOk":
             return [{"ok": True}]
 
-        assert response_json["result_type"] == "TuplesOk", response_json
-        result = response_json["result"]
-        column_names = result[0]
-        return [dict(zip(column_names, row)) for row in result[1:]]
+        assert response_json["result_type"] == "TuplesOk", _materialize(response_json)
+        rows = iter(response_json["result"])
+        column_names = tuple(next(rows))
+        return list(map(_get_row_builder(column_names), rows))
 
 
 class HasuraError(Exception):
@@ -235,6 +1053,8 @@ class HasuraError(Exception):
                 assert error.value.response == {"errors": [...]}
     """
 
+    __slots__ = ("response",)
+
     def __init__(self, response: Dict[str, Any]):
         self.response = response
         super().__init__(response)
@@ -26,3 +26,10 @@ def test_create_client_stores_args():
     assert hasura.graphql_endpoint == "http://localhost:8080/v1/graphql"
     assert hasura.sql_endpoint == "http://localhost:8080/v2/query"
     assert hasura.admin_secret == "fake secret"
+
+
+def test_client_is_context_manager() -> None:
+    with Hasura("http://localhost:8080") as hasura:
+        assert not hasura._client.is_closed
+
+    assert hasura._client.is_closed
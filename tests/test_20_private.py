@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from ahasura import ADMIN, Hasura, HasuraError
@@ -35,27 +37,27 @@ def test_get_headers_for_non_admin_with_custom_headers(hasura: Hasura) -> None:
 
 
 #
-# _get_run_sql_content
+# _get_run_sql_body
 #
 
 
-def test_get_run_sql_content_for_select(hasura: Hasura) -> None:
+def test_get_run_sql_body_for_select(hasura: Hasura) -> None:
     query = """
         SeLeCt NULL;
     """
 
-    assert hasura._get_run_sql_content(query) == {
+    assert json.loads(hasura._get_run_sql_body(query)) == {
         "type": "run_sql",
         "args": {"sql": query, "read_only": True},
     }
 
 
-def test_get_run_sql_content_for_non_select(hasura: Hasura) -> None:
+def test_get_run_sql_body_for_non_select(hasura: Hasura) -> None:
     query = """
         InSeRt INTO "fake_table" ("fake_column") VALUES ("fake_value");
     """
 
-    assert hasura._get_run_sql_content(query) == {
+    assert json.loads(hasura._get_run_sql_body(query)) == {
         "type": "run_sql",
         "args": {"sql": query, "read_only": False},
     }
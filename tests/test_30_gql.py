@@ -1,20 +1,19 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from ahasura import ADMIN, Hasura, HasuraError
+from ahasura import ADMIN, Hasura, HasuraError, _dumps
 
 
 def test_gql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
-    post = mocker.patch("httpx.post")
-    post.return_value.json.return_value = {"data": {"item": [{"id": "fake"}]}}
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"item": [{"id": "fake"}]}})
 
     assert hasura.gql("query { item { id }}", auth=ADMIN) == {"item": [{"id": "fake"}]}
 
     post.assert_called_once_with(
         "http://localhost:8080/v1/graphql",
         headers={"x-hasura-admin-secret": "fake secret"},
-        json={"query": "query { item { id }}", "variables": {}},
-        timeout=10,
+        content=_dumps({"query": "query { item { id }}"}),
     )
 
 
@@ -22,8 +21,8 @@ def test_gql_shortcut_and_auth_and_headers_and_vars(
     hasura: Hasura,
     mocker: MockerFixture,
 ) -> None:
-    post = mocker.patch("httpx.post")
-    post.return_value.json.return_value = {"data": {"item": [{"id": "fake"}]}}
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"item": [{"id": "fake"}]}})
 
     data = hasura(
         "query($name: String!) {...}",
@@ -37,23 +36,108 @@ def test_gql_shortcut_and_auth_and_headers_and_vars(
     post.assert_called_once_with(
         "http://localhost:8080/v1/graphql",
         headers={"authorization": "Bearer REDACTED", "x-hasura-something": "special"},
-        json={"query": "query($name: String!) {...}", "variables": {"name": "value"}},
-        timeout=10,
+        content=_dumps(
+            {"query": "query($name: String!) {...}", "variables": {"name": "value"}}
+        ),
+    )
+
+
+def test_gql_merges_variables_dict_and_kwargs(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"item": [{"id": "fake"}]}})
+
+    hasura(
+        "query($name: String!, $size: Int!) {...}",
+        auth=ADMIN,
+        variables={"name": "value"},
+        size=42,
+    )
+
+    post.assert_called_once_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            {
+                "query": "query($name: String!, $size: Int!) {...}",
+                "variables": {"name": "value", "size": 42},
+            }
+        ),
     )
 
 
 def test_gql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
-    post = mocker.patch("httpx.post")
-    post.return_value.json.return_value = {"errors": "fake errors"}
+    post = mocker.patch.object(hasura._client, "post")
+    response_json = {"errors": "fake errors", "code": "validation-failed"}
+    post.return_value.content = _dumps(response_json)
 
     with pytest.raises(HasuraError) as error:
         hasura("bad query", auth=ADMIN)
 
-    assert error.value.response == {"errors": "fake errors"}
+    assert error.value.response == response_json
 
     post.assert_called_once_with(
         "http://localhost:8080/v1/graphql",
         headers={"x-hasura-admin-secret": "fake secret"},
-        json={"query": "bad query", "variables": {}},
-        timeout=10,
+        content=_dumps({"query": "bad query"}),
+    )
+
+
+def test_gql_batch_returns_ok_list(hasura: Hasura, mocker: MockerFixture) -> None:
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps(
+        [{"data": {"item": [{"id": "fake"}]}}, {"data": {"other": []}}]
+    )
+
+    data_list = hasura.gql_batch(
+        [
+            ("query { item { id }}", None),
+            ("query($id: uuid!) { other_by_pk(id: $id) {...}}", {"id": "fake id"}),
+        ],
+        auth=ADMIN,
     )
+
+    assert data_list == [{"item": [{"id": "fake"}]}, {"other": []}]
+
+    post.assert_called_once_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            [
+                {"query": "query { item { id }}"},
+                {
+                    "query": "query($id: uuid!) { other_by_pk(id: $id) {...}}",
+                    "variables": {"id": "fake id"},
+                },
+            ]
+        ),
+    )
+
+
+def test_gql_batch_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps(
+        [{"data": {"item": []}}, {"errors": "fake errors"}]
+    )
+
+    with pytest.raises(HasuraError) as error:
+        hasura.gql_batch([("query1", None), ("bad query", None)], auth=ADMIN)
+
+    assert error.value.response == {"errors": "fake errors"}
+
+
+def test_gql_batch_raises_HasuraError_on_request_level_error(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    post = mocker.patch.object(hasura._client, "post")
+    # E.g. bad auth rejects the whole batch with a single error object
+    response_json = {"errors": [{"message": "Malformed Authorization header"}]}
+    post.return_value.content = _dumps(response_json)
+
+    with pytest.raises(HasuraError) as error:
+        hasura.gql_batch([("query1", None)], auth="Bearer bad")
+
+    assert error.value.response == response_json
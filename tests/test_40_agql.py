@@ -1,16 +1,24 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from ahasura import ADMIN, Hasura, HasuraError
+from ahasura import ADMIN, Hasura, HasuraError, _dumps
 
 pytestmark = pytest.mark.anyio
 
 
+async def test_aclient_is_lazy_and_aclose_resets_it() -> None:
+    async with Hasura("http://localhost:8080") as hasura:
+        assert hasura._aclient is None
+        aclient = await hasura._get_aclient()
+        assert await hasura._get_aclient() is aclient
+
+    assert hasura._aclient is None
+
+
 async def test_agql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
-    asyncClient = mocker.patch("httpx.AsyncClient").return_value
-    asyncClient.__aenter__ = mocker.AsyncMock()
-    post = asyncClient.__aenter__.return_value.post
-    post.return_value.json = mocker.Mock(return_value={"data": {"item": [{"id": "X"}]}})
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps({"data": {"item": [{"id": "X"}]}})
 
     ahasura = hasura.agql
 
@@ -26,16 +34,16 @@ async def test_agql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
     post.assert_awaited_once_with(
         "http://localhost:8080/v1/graphql",
         headers={"authorization": "Bearer REDACTED", "x-hasura-something": "special"},
-        json={"query": "query($name: String!) {...}", "variables": {"name": "value"}},
-        timeout=10,
+        content=_dumps(
+            {"query": "query($name: String!) {...}", "variables": {"name": "value"}}
+        ),
     )
 
 
 async def test_agql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
-    asyncClient = mocker.patch("httpx.AsyncClient").return_value
-    asyncClient.__aenter__ = mocker.AsyncMock()
-    post = asyncClient.__aenter__.return_value.post
-    post.return_value.json = mocker.Mock(return_value={"errors": "fake errors"})
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps({"errors": "fake errors"})
 
     ahasura = hasura.agql
 
@@ -47,6 +55,31 @@ async def test_agql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) ->
     post.assert_awaited_once_with(
         "http://localhost:8080/v1/graphql",
         headers={"x-hasura-admin-secret": "fake secret"},
-        json={"query": "bad query", "variables": {}},
-        timeout=10,
+        content=_dumps({"query": "bad query"}),
+    )
+
+
+async def test_agql_batch_returns_ok_list(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps(
+        [{"data": {"item": [{"id": "X"}]}}, {"data": {"other": []}}]
+    )
+
+    data_list = await hasura.agql_batch(
+        [("query { item { id }}", None), ("query { other {...}}", None)],
+        auth=ADMIN,
+    )
+
+    assert data_list == [{"item": [{"id": "X"}]}, {"other": []}]
+
+    post.assert_awaited_once_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            [{"query": "query { item { id }}"}, {"query": "query { other {...}}"}]
+        ),
     )
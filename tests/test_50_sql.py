@@ -1,12 +1,11 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from ahasura import Hasura, HasuraError
+from ahasura import Hasura, HasuraError, _dumps
 
 
 def test_sql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
-    post = mocker.patch("httpx.post")
-    post.return_value.json.return_value = {
+    response_json = {
         "result_type": "TuplesOk",
         "result": [
             ("column1", "column2"),
@@ -15,6 +14,9 @@ def test_sql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
         ],
     }
 
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps(response_json)
+
     data = hasura.sql(
         'SELECT "column1", "column2" FROM "table"',
         headers={"x-hasura-something": "special"},
@@ -31,29 +33,22 @@ def test_sql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
             "x-hasura-admin-secret": "fake secret",
             "x-hasura-something": "special",
         },
-        json={
-            "type": "run_sql",
-            "args": {
-                "sql": 'SELECT "column1", "column2" FROM "table"',
-                "read_only": True,
-            },
-        },
-        timeout=10,
+        content=hasura._get_run_sql_body('SELECT "column1", "column2" FROM "table"'),
     )
 
 
 def test_sql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
-    post = mocker.patch("httpx.post")
-    post.return_value.json.return_value = {"error": "fake error"}
+    post = mocker.patch.object(hasura._client, "post")
+    response_json = {"error": "fake error", "path": "$", "code": "postgres-error"}
+    post.return_value.content = _dumps(response_json)
 
     with pytest.raises(HasuraError) as error:
         hasura.sql("bad query")
 
-    assert error.value.response == {"error": "fake error"}
+    assert error.value.response == response_json
 
     post.assert_called_once_with(
         "http://localhost:8080/v2/query",
         headers={"x-hasura-admin-secret": "fake secret"},
-        json={"type": "run_sql", "args": {"sql": "bad query", "read_only": False}},
-        timeout=10,
+        content=hasura._get_run_sql_body("bad query"),
     )
@@ -1,7 +1,7 @@
 import pytest
 from pytest_mock import MockerFixture
 
-from ahasura import Hasura, HasuraError
+from ahasura import Hasura, HasuraError, _dumps
 
 pytestmark = pytest.mark.anyio
 
@@ -16,10 +16,9 @@ async def test_asql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
         ],
     }
 
-    asyncClient = mocker.patch("httpx.AsyncClient").return_value
-    asyncClient.__aenter__ = mocker.AsyncMock()
-    post = asyncClient.__aenter__.return_value.post
-    post.return_value.json = mocker.Mock(return_value=response_json)
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps(response_json)
 
     data = await hasura.asql(
         'SELECT "column1", "column2" FROM "table"',
@@ -37,22 +36,14 @@ async def test_asql_returns_ok(hasura: Hasura, mocker: MockerFixture) -> None:
             "x-hasura-admin-secret": "fake secret",
             "x-hasura-something": "special",
         },
-        json={
-            "type": "run_sql",
-            "args": {
-                "sql": 'SELECT "column1", "column2" FROM "table"',
-                "read_only": True,
-            },
-        },
-        timeout=10,
+        content=hasura._get_run_sql_body('SELECT "column1", "column2" FROM "table"'),
     )
 
 
 async def test_asql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
-    asyncClient = mocker.patch("httpx.AsyncClient").return_value
-    asyncClient.__aenter__ = mocker.AsyncMock()
-    post = asyncClient.__aenter__.return_value.post
-    post.return_value.json = mocker.Mock(return_value={"error": "fake error"})
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps({"error": "fake error"})
 
     with pytest.raises(HasuraError) as error:
         await hasura.asql("bad query")
@@ -62,6 +53,5 @@ async def test_asql_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) ->
     post.assert_awaited_once_with(
         "http://localhost:8080/v2/query",
         headers={"x-hasura-admin-secret": "fake secret"},
-        json={"type": "run_sql", "args": {"sql": "bad query", "read_only": False}},
-        timeout=10,
+        content=hasura._get_run_sql_body("bad query"),
     )
@@ -0,0 +1,86 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from ahasura import ADMIN, Hasura, _dumps
+
+
+def test_introspect_caches_on_client(mocker: MockerFixture) -> None:
+    hasura = Hasura("http://localhost:8080", admin_secret="fake secret")
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+
+    assert hasura.introspect(auth=ADMIN) == {"__schema": {"types": []}}
+    assert hasura.introspect(auth=ADMIN) == {"__schema": {"types": []}}
+
+    post.assert_called_once()
+
+
+def test_introspect_with_expired_ttl_refetches(mocker: MockerFixture) -> None:
+    hasura = Hasura("http://localhost:8080", admin_secret="fake secret")
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+
+    hasura.introspect(auth=ADMIN)
+    data, cached_time = hasura._introspection[ADMIN]
+    hasura._introspection[ADMIN] = (data, cached_time - 100)  # 100 seconds old
+    hasura.introspect(auth=ADMIN, ttl=10)
+
+    assert post.call_count == 2
+
+
+def test_introspect_persists_to_cache_path(mocker: MockerFixture, tmp_path) -> None:
+    cache_path = str(tmp_path / "introspection.json")
+
+    hasura1 = Hasura("http://localhost:8080", admin_secret="fake secret")
+    post1 = mocker.patch.object(hasura1._client, "post")
+    post1.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+    hasura1.introspect(auth=ADMIN, cache_path=cache_path)
+
+    hasura2 = Hasura("http://localhost:8080", admin_secret="fake secret")
+    post2 = mocker.patch.object(hasura2._client, "post")
+    data = hasura2.introspect(auth=ADMIN, cache_path=cache_path)
+
+    assert data == {"__schema": {"types": []}}
+    post2.assert_not_called()
+
+
+def test_introspect_refetches_on_corrupt_cache_file(
+    mocker: MockerFixture, tmp_path
+) -> None:
+    cache_path = str(tmp_path / "introspection.json")
+
+    hasura = Hasura("http://localhost:8080", admin_secret="fake secret")
+    auth_path = hasura._get_introspection_path(cache_path, ADMIN)
+    with open(auth_path, "wb") as cache_file:
+        cache_file.write(b'{"truncated')  # Crash mid-write
+
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+    data = hasura.introspect(auth=ADMIN, cache_path=cache_path)
+
+    assert data == {"__schema": {"types": []}}
+    post.assert_called_once()
+
+
+def test_introspect_caches_per_auth(mocker: MockerFixture) -> None:
+    hasura = Hasura("http://localhost:8080", admin_secret="fake secret")
+    post = mocker.patch.object(hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+
+    hasura.introspect(auth=ADMIN)
+    hasura.introspect(auth="Bearer REDACTED")  # Different role: no cache reuse
+
+    assert post.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_aintrospect_caches_on_client(mocker: MockerFixture) -> None:
+    hasura = Hasura("http://localhost:8080", admin_secret="fake secret")
+    aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps({"data": {"__schema": {"types": []}}})
+
+    assert await hasura.aintrospect(auth=ADMIN) == {"__schema": {"types": []}}
+    assert await hasura.aintrospect(auth=ADMIN) == {"__schema": {"types": []}}
+
+    post.assert_awaited_once()
@@ -0,0 +1,107 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from ahasura import ADMIN, Hasura, _dumps, _get_query_hash
+
+
+@pytest.fixture()
+def persisted_hasura() -> Hasura:
+    return Hasura(
+        "http://localhost:8080",
+        admin_secret="fake secret",
+        persisted_queries=True,
+    )
+
+
+def test_gql_sends_query_hash_only(
+    persisted_hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    post = mocker.patch.object(persisted_hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"item": [{"id": "fake"}]}})
+
+    data = persisted_hasura("query { item { id }}", auth=ADMIN)
+
+    assert data == {"item": [{"id": "fake"}]}
+
+    post.assert_called_once_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            {
+                "extensions": {
+                    "persistedQuery": {
+                        "version": 1,
+                        "sha256Hash": _get_query_hash("query { item { id }}"),
+                    }
+                }
+            }
+        ),
+    )
+
+
+def test_gql_resends_full_query_if_not_found(
+    persisted_hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    post = mocker.patch.object(persisted_hasura._client, "post")
+    post.return_value.content = _dumps({"data": {"item": []}})
+    first_response = mocker.Mock(
+        content=_dumps({"errors": [{"message": "PersistedQueryNotFound"}]})
+    )
+    post.side_effect = [first_response, post.return_value]
+
+    data = persisted_hasura("query { item { id }}", auth=ADMIN)
+
+    assert data == {"item": []}
+    assert post.call_count == 2
+
+    post.assert_called_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            {
+                "query": "query { item { id }}",
+                "extensions": {
+                    "persistedQuery": {
+                        "version": 1,
+                        "sha256Hash": _get_query_hash("query { item { id }}"),
+                    }
+                },
+            }
+        ),
+    )
+
+
+@pytest.mark.anyio
+async def test_agql_sends_query_hash_only(
+    persisted_hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    aclient = mocker.patch.object(persisted_hasura, "_aclient", mocker.AsyncMock())
+    post = aclient.post
+    post.return_value.content = _dumps({"data": {"item": [{"id": "X"}]}})
+
+    data = await persisted_hasura.agql(
+        "query($name: String!) {...}",
+        auth=ADMIN,
+        name="value",
+    )
+
+    assert data == {"item": [{"id": "X"}]}
+
+    post.assert_awaited_once_with(
+        "http://localhost:8080/v1/graphql",
+        headers={"x-hasura-admin-secret": "fake secret"},
+        content=_dumps(
+            {
+                "variables": {"name": "value"},
+                "extensions": {
+                    "persistedQuery": {
+                        "version": 1,
+                        "sha256Hash": _get_query_hash("query($name: String!) {...}"),
+                    }
+                },
+            }
+        ),
+    )
@@ -0,0 +1,88 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from ahasura import Hasura, HasuraError, _dumps, ijson
+
+RESPONSE_JSON = {
+    "result_type": "TuplesOk",
+    "result": [
+        ("column1", "column2"),
+        ("value11", "value12"),
+        ("value21", "value22"),
+    ],
+}
+
+EXPECTED_ROWS = [
+    {"column1": "value11", "column2": "value12"},
+    {"column1": "value21", "column2": "value22"},
+]
+
+
+def _mock_response_body(hasura: Hasura, mocker: MockerFixture, body: bytes) -> None:
+    """Mock the transport for `sql_iter`: streamed if `ijson` is installed,
+    else the buffered `sql` fallback"""
+    if ijson is None:
+        post = mocker.patch.object(hasura._client, "post")
+        post.return_value.content = body
+    else:
+        stream = mocker.patch.object(hasura._client, "stream")
+        response = stream.return_value.__enter__.return_value
+        response.iter_bytes.return_value = iter([body])
+
+
+def test_sql_iter_yields_ok_dicts_for_TuplesOk(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    _mock_response_body(hasura, mocker, _dumps(RESPONSE_JSON))
+
+    assert list(hasura.sql_iter('SELECT "column1", "column2" FROM "table"')) == (
+        EXPECTED_ROWS
+    )
+
+
+def test_sql_iter_yields_ok_for_CommandOk(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    _mock_response_body(hasura, mocker, _dumps({"result_type": "CommandOk"}))
+
+    assert list(hasura.sql_iter("bad query")) == [{"ok": True}]
+
+
+def test_sql_iter_raises_HasuraError(hasura: Hasura, mocker: MockerFixture) -> None:
+    response_json = {
+        "error": "fake error",
+        "path": "$",
+        "code": "postgres-error",
+        "internal": {"statement": "bad query", "error": {"message": "syntax error"}},
+    }
+    _mock_response_body(hasura, mocker, _dumps(response_json))
+
+    with pytest.raises(HasuraError) as error:
+        list(hasura.sql_iter("bad query"))
+
+    assert error.value.response == response_json
+
+
+@pytest.mark.anyio
+async def test_asql_iter_yields_ok_dicts_for_TuplesOk(
+    hasura: Hasura,
+    mocker: MockerFixture,
+) -> None:
+    body = _dumps(RESPONSE_JSON)
+
+    if ijson is None:
+        aclient = mocker.patch.object(hasura, "_aclient", mocker.AsyncMock())
+        aclient.post.return_value.content = body
+    else:
+        aclient = mocker.patch.object(hasura, "_aclient", mocker.MagicMock())
+        response = aclient.stream.return_value.__aenter__.return_value
+
+        async def aiter_bytes():
+            yield body
+
+        response.aiter_bytes = aiter_bytes
+
+    rows = [row async for row in hasura.asql_iter('SELECT * FROM "table"')]
+    assert rows == EXPECTED_ROWS